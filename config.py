@@ -33,6 +33,13 @@ BYBIT_API_SECRET = os.getenv('BYBIT_API_SECRET', '')
 # Logging
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
+# Seconds a fetched account balance is reused (invalidated after every trade)
+BALANCE_CACHE_TTL = float(os.getenv('BALANCE_CACHE_TTL', '5'))
+
+# Markets cache (seconds a cached markets snapshot is reused, 0 disables it)
+MARKETS_CACHE_TTL = int(os.getenv('MARKETS_CACHE_TTL', '3600'))
+MARKETS_CACHE_DIR = os.path.expanduser(os.getenv('MARKETS_CACHE_DIR') or os.path.join('~', '.cache', 'bpet'))
+
 # List of supported exchanges
 SUPPORTED_EXCHANGES = [
     'mexc',
@@ -1,10 +1,87 @@
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import ccxt
 from loguru import logger
 import config
+from markets_cache import FileCache
+
+# Exchange id -> (ccxt class name, builder of its API credentials from config)
+# Classes are looked up on use, so one missing from the installed ccxt only affects its own exchange
+EXCHANGE_REGISTRY = {
+    'mexc': ('mexc', lambda c: {
+        'apiKey': c.MEXC_API_KEY,
+        'secret': c.MEXC_API_SECRET,
+    }),
+    'kucoin': ('kucoin', lambda c: {
+        'apiKey': c.KUCOIN_API_KEY,
+        'secret': c.KUCOIN_API_SECRET,
+        'password': c.KUCOIN_API_PASSPHRASE
+    }),
+    'htx': ('htx', lambda c: {
+        'apiKey': c.HTX_API_KEY,
+        'secret': c.HTX_API_SECRET,
+    }),
+    'gateio': ('gateio', lambda c: {
+        'apiKey': c.GATE_API_KEY,
+        'secret': c.GATE_API_SECRET,
+    }),
+    'bitmart': ('bitmart', lambda c: {
+        'apiKey': c.BITMART_API_KEY,
+        'secret': c.BITMART_API_SECRET,
+        'uid': c.BITMART_MEMO
+    }),
+    'bitget': ('bitget', lambda c: {
+        'apiKey': c.BITGET_API_KEY,
+        'secret': c.BITGET_API_SECRET,
+        'password': c.BITGET_API_PASSPHRASE
+    }),
+    'bybit': ('bybit', lambda c: {
+        'apiKey': c.BYBIT_API_KEY,
+        'secret': c.BYBIT_API_SECRET,
+    }),
+}
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_symbol(symbol, quote):
+    """Uppercase symbol and add the quote currency if no separator is given"""
+    symbol = symbol.upper()
+    return symbol if '/' in symbol else f"{symbol}/{quote}"
+
+@functools.lru_cache(maxsize=1024)
+def _base_currency(currency):
+    """Uppercase currency code, taking the base currency if a pair is given"""
+    return currency.split('/')[0].upper()
+
+# Most orders accepted per create_orders request, by exchange
+MAX_BATCH_ORDERS = {
+    'bybit': 10,
+    'gateio': 10,
+}
+DEFAULT_MAX_BATCH_ORDERS = 5
+
+# Markets snapshots shared by all handlers and across runs
+markets_cache = FileCache(config.MARKETS_CACHE_DIR, config.MARKETS_CACHE_TTL)
 
 class ExchangeHandler:
-    def __init__(self, exchange_id, sandbox=False):
-        """Initialize exchange connection with API keys from config"""
+    # Loaded markets per cache key as (markets, from_disk_cache), shared by all
+    # handlers of the same exchange so only the first one fetches them
+    _shared_markets = {}
+    _shared_markets_locks = {}
+    _shared_markets_guard = threading.Lock()
+    
+    def __init__(self, exchange_id, sandbox=False, balance_ttl=None):
+        """
+        Initialize exchange connection with API keys from config
+        
+        Args:
+            exchange_id: One of config.SUPPORTED_EXCHANGES
+            sandbox: Use the exchange's sandbox/testnet if available
+            balance_ttl: Seconds a fetched balance is reused before refetching,
+                defaults to config.BALANCE_CACHE_TTL
+        """
         
         # Validate exchange is supported
         exchange_id = exchange_id.lower()
@@ -18,61 +95,22 @@ class ExchangeHandler:
             'enableRateLimit': True
         }
         
-        if exchange_id == 'mexc':
-            exchange_options.update({
-                'apiKey': config.MEXC_API_KEY,
-                'secret': config.MEXC_API_SECRET,
-            })
-            exchange_class = ccxt.mexc
-            
-        elif exchange_id == 'kucoin':
-            exchange_options.update({
-                'apiKey': config.KUCOIN_API_KEY,
-                'secret': config.KUCOIN_API_SECRET,
-                'password': config.KUCOIN_API_PASSPHRASE
-            })
-            exchange_class = ccxt.kucoin
-            
-        elif exchange_id == 'htx':
-            exchange_options.update({
-                'apiKey': config.HTX_API_KEY,
-                'secret': config.HTX_API_SECRET,
-            })
-            exchange_class = ccxt.htx
-            
-        elif exchange_id == 'gateio':
-            exchange_options.update({
-                'apiKey': config.GATE_API_KEY,
-                'secret': config.GATE_API_SECRET,
-            })
-            exchange_class = ccxt.gateio
-            
-        elif exchange_id == 'bitmart':
-            exchange_options.update({
-                'apiKey': config.BITMART_API_KEY,
-                'secret': config.BITMART_API_SECRET,
-                'uid': config.BITMART_MEMO
-            })
-            exchange_class = ccxt.bitmart
-            
-        elif exchange_id == 'bitget':
-            exchange_options.update({
-                'apiKey': config.BITGET_API_KEY,
-                'secret': config.BITGET_API_SECRET,
-                'password': config.BITGET_API_PASSPHRASE
-            })
-            exchange_class = ccxt.bitget
-            
-        elif exchange_id == 'bybit':
-            exchange_options.update({
-                'apiKey': config.BYBIT_API_KEY,
-                'secret': config.BYBIT_API_SECRET,
-            })
-            exchange_class = ccxt.bybit
+        class_name, credentials = EXCHANGE_REGISTRY[exchange_id]
+        exchange_class = getattr(ccxt, class_name, None)
+        if exchange_class is None:
+            logger.error(f"Exchange {exchange_id} is not available in the installed ccxt {ccxt.__version__}")
+            raise ValueError(f"Exchange {exchange_id} is not available in ccxt {ccxt.__version__}")
+        exchange_options.update(credentials(config))
         
         # Create exchange instance
         self.exchange = exchange_class(exchange_options)
         self.exchange_id = exchange_id
+        self._serialize_throttle()
+        
+        # Short-lived balance cache to coalesce repeated fetch_balance calls
+        self.balance_ttl = config.BALANCE_CACHE_TTL if balance_ttl is None else balance_ttl
+        self._balances = None
+        self._balances_fetched_at = 0.0
         
         # Use sandbox/testnet if specifically requested
         if sandbox and hasattr(self.exchange, 'set_sandbox_mode'):
@@ -83,21 +121,100 @@ class ExchangeHandler:
         
         # Load markets
         logger.info(f"Connecting to {exchange_id}...")
-        self.exchange.load_markets()
+        self._load_markets(sandbox)
+        self._index_markets()
         logger.info(f"Connected to {exchange_id} successfully")
+    
+    def _serialize_throttle(self):
+        """
+        Make the ccxt rate limiter safe to share between threads
+        
+        The sync client's throttle() reads lastRestRequestTimestamp without a
+        lock, so concurrent calls all see the same timestamp and none of them
+        wait. Throttling and stamping the request time under one lock spaces
+        requests rateLimit apart while their responses are still awaited in
+        parallel.
+        """
+        exchange = self.exchange
+        throttle = exchange.throttle
+        lock = threading.Lock()
+        
+        def locked_throttle(*args, **kwargs):
+            with lock:
+                throttle(*args, **kwargs)
+                exchange.lastRestRequestTimestamp = exchange.milliseconds()
+        
+        exchange.throttle = locked_throttle
+    
+    @classmethod
+    def _markets_lock(cls, cache_key):
+        """Get the lock serializing market loads for one exchange"""
+        with cls._shared_markets_guard:
+            return cls._shared_markets_locks.setdefault(cache_key, threading.Lock())
+    
+    def _load_markets(self, sandbox):
+        """
+        Load markets, preferring a snapshot already loaded by another handler,
+        then the on-disk cache, and only then the exchange itself
+        """
+        # Keyed by ccxt version too, market structures can change between releases
+        mode = "sandbox_markets" if sandbox else "markets"
+        self._markets_cache_key = f"{self.exchange_id}_{mode}_{ccxt.__version__}"
+        
+        with self._markets_lock(self._markets_cache_key):
+            shared = ExchangeHandler._shared_markets.get(self._markets_cache_key)
+            if shared:
+                markets, self._markets_from_cache = shared
+                self.exchange.set_markets(markets)
+                return
+            
+            markets = markets_cache.get(self._markets_cache_key)
+            self._markets_from_cache = bool(markets)
+            if markets:
+                self.exchange.set_markets(markets)
+                logger.debug("Loaded {} {} markets from cache", len(markets), self.exchange_id)
+            else:
+                self.exchange.load_markets()
+                markets_cache.set(self._markets_cache_key, self.exchange.markets)
+            
+            ExchangeHandler._shared_markets[self._markets_cache_key] = (self.exchange.markets, self._markets_from_cache)
+    
+    def _refresh_markets(self):
+        """Replace a cached markets snapshot with a fresh one from the exchange"""
+        logger.info(f"Refreshing {self.exchange_id} markets...")
+        with self._markets_lock(self._markets_cache_key):
+            self.exchange.load_markets(reload=True)
+            markets_cache.set(self._markets_cache_key, self.exchange.markets)
+            ExchangeHandler._shared_markets[self._markets_cache_key] = (self.exchange.markets, False)
+        self._markets_from_cache = False
+        self._index_markets()
+    
+    def _index_markets(self):
+        """Precompute the market metadata used on every lookup and trade"""
+        markets = self.exchange.markets
+        self._symbols = frozenset(markets)
+        self._precision_amount = {
+            symbol: market['precision']['amount']
+            for symbol, market in markets.items()
+            if 'precision' in market and 'amount' in market['precision']
+        }
         
     def check_pair_exists(self, symbol):
         """Check if trading pair exists on exchange and format it properly"""
+        # Fast path: symbol is already in canonical form
+        if symbol in self._symbols:
+            return True, symbol
+        
         try:
-            # Try to standardize the symbol format
-            symbol = symbol.upper()
+            # Standardize the symbol format, adding USDT as quote if no separator
+            symbol = _normalize_symbol(symbol, config.QUOTE_CURRENCY)
             
-            # If no separator provided, add USDT as the quote currency
-            if '/' not in symbol:
-                symbol = f"{symbol}/{config.QUOTE_CURRENCY}"
+            # A cached snapshot may predate a new listing, refresh it before giving up
+            if symbol not in self._symbols and self._markets_from_cache:
+                self._refresh_markets()
             
             # Check if the symbol exists in markets
-            if symbol not in self.exchange.markets:
+            if symbol not in self._symbols:
                 logger.error(f"Trading pair {symbol} not found on {self.exchange_id}")
                 return False, None
             
@@ -111,12 +228,45 @@ class ExchangeHandler:
         """Get current ticker data for symbol"""
         try:
             ticker = self.exchange.fetch_ticker(symbol)
-            logger.info(f"Current price for {symbol}: {ticker['last']}")
+            logger.info("Current price for {}: {}", symbol, ticker['last'])
             return ticker
         except Exception as e:
             logger.error(f"Error fetching ticker for {symbol}: {e}")
             return None
     
+    def get_tickers(self, symbols):
+        """
+        Get tickers for several symbols, in one request when the exchange supports it
+        
+        Returns:
+            Dictionary of symbol -> ticker, symbols that could not be fetched are left out
+        """
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+        
+        if self.exchange.has.get('fetchTickers'):
+            try:
+                tickers = self.exchange.fetch_tickers(symbols)
+                return {symbol: tickers[symbol] for symbol in symbols if symbol in tickers}
+            except Exception as e:
+                logger.warning(f"Error fetching tickers in one request, fetching them one by one: {e}")
+        
+        tickers = self.map('get_ticker', [(symbol,) for symbol in symbols])
+        return {symbol: ticker for symbol, ticker in zip(symbols, tickers) if ticker}
+    
+    def _cached_balances(self):
+        """Return fetch_balance() result, reusing it for balance_ttl seconds"""
+        now = time.monotonic()
+        if self._balances is None or now - self._balances_fetched_at >= self.balance_ttl:
+            self._balances = self.exchange.fetch_balance()
+            self._balances_fetched_at = now
+        return self._balances
+    
+    def _invalidate_balances(self):
+        """Drop the cached balances, e.g. after an order changed them"""
+        self._balances = None
+    
     def get_balance(self, currency=None):
         """
         Get balance for specified currency or all currencies with non-zero balance
@@ -129,31 +279,28 @@ class ExchangeHandler:
             For all currencies: Dictionary of non-zero balances
         """
         try:
-            balances = self.exchange.fetch_balance()
+            balances = self._cached_balances()
             
             if currency:
                 # Get specific currency balance
-                currency = currency.split('/')[0] if '/' in currency else currency
-                currency = currency.upper()
+                currency = _base_currency(currency)
                 
                 if currency in balances['free']:
                     free_balance = balances['free'][currency]
                     total_balance = balances['total'][currency]
-                    logger.info(f"{currency} balance - Free: {free_balance}, Total: {total_balance}")
+                    logger.info("{} balance - Free: {}, Total: {}", currency, free_balance, total_balance)
                     return free_balance, total_balance
                 else:
-                    logger.warning(f"No balance found for {currency}")
+                    logger.warning("No balance found for {}", currency)
                     return 0, 0
             else:
                 # Return all non-zero balances
-                non_zero = {}
-                for curr, amount in balances['free'].items():
-                    if amount > 0:
-                        non_zero[curr] = {
-                            'free': amount,
-                            'total': balances['total'][curr]
-                        }
-                return non_zero
+                free, total = balances['free'], balances['total']
+                return {
+                    curr: {'free': amount, 'total': total.get(curr, amount)}
+                    for curr, amount in free.items()
+                    if amount and amount > 0
+                }
                 
         except Exception as e:
             logger.error(f"Error fetching balance: {e}")
@@ -162,40 +309,70 @@ class ExchangeHandler:
             else:
                 return {}
     
-    def buy_token(self, symbol, amount):
+    def _last_price(self, symbol):
+        """Get last traded price for symbol, or None if the ticker is unavailable"""
+        ticker = self.get_ticker(symbol)
+        return ticker['last'] if ticker else None
+    
+    def _fetch_price_and_balance(self, symbol, currency, price_hint=None, check_balance=True):
+        """
+        Fetch last price and free currency balance concurrently
+        
+        The two REST calls are independent, so overlapping them costs one
+        round-trip instead of two before an order can be placed. A known
+        price_hint skips the ticker, check_balance=False skips the balance.
+        
+        Returns:
+            Tuple of (price or None, free_balance or None if not checked)
+        """
+        if not check_balance:
+            return price_hint or self._last_price(symbol), None
+        if price_hint:
+            return price_hint, self.get_balance(currency)[0]
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            price_future = executor.submit(self._last_price, symbol)
+            balance_future = executor.submit(self.get_balance, currency)
+            return price_future.result(), balance_future.result()[0]
+    
+    def buy_token(self, symbol, amount, price_hint=None, skip_precheck=False):
         """
         Buy token at market price
         
         Args:
             symbol: Trading pair
             amount: Amount to buy in USDT
+            price_hint: Known current price, skips the ticker request if given
+            skip_precheck: Skip the balance request and rely on the exchange
+                rejecting the order if funds are insufficient
             
         Returns:
             Order information or None if failed
         """
         try:
-            # Get current price
-            ticker = self.get_ticker(symbol)
-            if not ticker:
+            market = self.exchange.markets[symbol]
+            base_currency = market['base']
+            quote_currency = market['quote']
+            
+            # Get current price and quote balance in parallel
+            current_price, free_balance = self._fetch_price_and_balance(
+                symbol, quote_currency, price_hint, check_balance=not skip_precheck
+            )
+            if not current_price:
                 return None
             
-            current_price = ticker['last']
-            logger.info(f"Buying {symbol} at ~{current_price}")
+            logger.info("Buying {} at ~{}", symbol, current_price)
             
             # Calculate amount of base currency to buy
-            base_currency = symbol.split('/')[0]
-            quote_currency = symbol.split('/')[1]
             base_amount = amount / current_price
             
             # Check if we have enough balance
-            free_balance, _ = self.get_balance(quote_currency)
-            if free_balance < amount:
+            if free_balance is not None and free_balance < amount:
                 logger.error(f"Insufficient balance: {free_balance} {quote_currency}, need {amount}")
                 return None
             
             # Format according to exchange precision
-            market = self.exchange.markets[symbol]
-            if 'precision' in market and 'amount' in market['precision']:
+            if symbol in self._precision_amount:
                 base_amount = self.exchange.amount_to_precision(symbol, base_amount)
             
             # Place order - handle special cases for exchanges like HTX that require price for market buy
@@ -219,8 +396,9 @@ class ExchangeHandler:
             else:
                 # Standard market buy order
                 order = self.exchange.create_market_buy_order(symbol, float(base_amount))
-                
-            logger.info(f"Buy order placed and executed: {order['id']}")
+            
+            self._invalidate_balances()
+            logger.info("Buy order placed and executed: {}", order['id'])
             
             # Get filled details
             if 'price' in order and order['price']:
@@ -229,7 +407,7 @@ class ExchangeHandler:
                 # Some exchanges don't return price in the order response
                 filled_price = current_price
                 
-            logger.info(f"Bought {base_amount} {base_currency} at approximately {filled_price} {quote_currency}")
+            logger.info("Bought {} {} at approximately {} {}", base_amount, base_currency, filled_price, quote_currency)
             
             return {
                 'id': order['id'],
@@ -242,11 +420,15 @@ class ExchangeHandler:
                 'status': order.get('status', 'closed')
             }
             
+        except ccxt.InsufficientFunds as e:
+            logger.error(f"Insufficient balance for buying {symbol}: {e}")
+            return None
+            
         except Exception as e:
             logger.error(f"Error buying token: {e}")
             return None
     
-    def sell_token(self, symbol, amount=None, percentage=100):
+    def sell_token(self, symbol, amount=None, percentage=100, price_hint=None, skip_precheck=False):
         """
         Sell token at market price
         
@@ -254,40 +436,41 @@ class ExchangeHandler:
             symbol: Trading pair
             amount: Amount to sell in base currency, if None sell percentage of holdings
             percentage: Percentage of holdings to sell if amount is None (1-100)
+            price_hint: Known current price, skips the ticker request if given
+            skip_precheck: Skip the balance request when amount is given and rely
+                on the exchange rejecting the order if funds are insufficient
             
         Returns:
             Order information or None if failed
         """
         try:
-            # Get current price
-            ticker = self.get_ticker(symbol)
-            if not ticker:
-                return None
-            
-            current_price = ticker['last']
-            base_currency = symbol.split('/')[0]
+            base_currency = self.exchange.markets[symbol]['base']
             
-            # Get balance of base currency
-            free_balance, _ = self.get_balance(base_currency)
+            # Get current price and balance of base currency in parallel
+            current_price, free_balance = self._fetch_price_and_balance(
+                symbol, base_currency, price_hint, check_balance=amount is None or not skip_precheck
+            )
+            if not current_price:
+                return None
             
             # Determine amount to sell
             if amount is None:
                 amount = free_balance * (percentage / 100)
             
-            if free_balance < amount:
+            if free_balance is not None and free_balance < amount:
                 logger.error(f"Insufficient balance: {free_balance} {base_currency}, need {amount}")
                 return None
             
             # Format according to exchange precision
-            market = self.exchange.markets[symbol]
-            if 'precision' in market and 'amount' in market['precision']:
+            if symbol in self._precision_amount:
                 amount = self.exchange.amount_to_precision(symbol, amount)
             
-            logger.info(f"Selling {amount} {base_currency} at ~{current_price}")
+            logger.info("Selling {} {} at ~{}", amount, base_currency, current_price)
             
             # Place order
             order = self.exchange.create_market_sell_order(symbol, float(amount))
-            logger.info(f"Sell order placed and executed: {order['id']}")
+            self._invalidate_balances()
+            logger.info("Sell order placed and executed: {}", order['id'])
             
             # Get filled details
             if 'price' in order and order['price']:
@@ -297,7 +480,7 @@ class ExchangeHandler:
                 filled_price = current_price
                 
             total_value = float(amount) * filled_price
-            logger.info(f"Sold {amount} {base_currency} at approximately {filled_price}, total value: {total_value}")
+            logger.info("Sold {} {} at approximately {}, total value: {}", amount, base_currency, filled_price, total_value)
             
             return {
                 'id': order['id'],
@@ -310,6 +493,123 @@ class ExchangeHandler:
                 'status': order.get('status', 'closed')
             }
             
+        except ccxt.InsufficientFunds as e:
+            logger.error(f"Insufficient balance for selling {symbol}: {e}")
+            return None
+            
         except Exception as e:
             logger.error(f"Error selling token: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _place_market_buys(self, symbol, base_amounts, price):
+        """Place one group of market buys, in a single request when the exchange supports it"""
+        if self.exchange.has.get('createOrders'):
+            return self.exchange.create_orders([
+                {'symbol': symbol, 'type': 'market', 'side': 'buy', 'amount': amount, 'price': price}
+                for amount in base_amounts
+            ])
+        return [self.exchange.create_order(symbol, 'market', 'buy', amount, price) for amount in base_amounts]
+    
+    def batch_market_buy(self, symbol, base_amounts):
+        """
+        Place several market buy orders for one symbol in as few requests as possible
+        
+        Uses the exchange's batch order endpoint (ccxt create_orders) when it
+        has one, in groups no larger than the exchange accepts (MAX_BATCH_ORDERS),
+        otherwise places the orders one at a time. Unlike buy_token, amounts
+        are in the base currency.
+        
+        Args:
+            symbol: Trading pair
+            base_amounts: Amounts to buy in base currency, one order per amount
+            
+        Returns:
+            List of ccxt orders the exchange accepted, or None if none were placed
+        """
+        placed = []
+        try:
+            # Exchanges that price market buys by cost need a reference price
+            current_price = self._last_price(symbol)
+            if not current_price:
+                return None
+            
+            if symbol in self._precision_amount:
+                base_amounts = [float(self.exchange.amount_to_precision(symbol, amount)) for amount in base_amounts]
+            
+            # Without a batch endpoint go one order at a time, so a failure never hides orders already placed
+            if self.exchange.has.get('createOrders'):
+                group_size = MAX_BATCH_ORDERS.get(self.exchange_id, DEFAULT_MAX_BATCH_ORDERS)
+            else:
+                group_size = 1
+            
+            for start in range(0, len(base_amounts), group_size):
+                orders = self._place_market_buys(symbol, base_amounts[start:start + group_size], current_price)
+                for order in orders:
+                    # Batch endpoints report per-order failures inside a successful response
+                    if order.get('id') and order.get('status') != 'rejected':
+                        placed.append(order)
+                    else:
+                        logger.error("Batch buy order for {} rejected: {}", symbol, order.get('info'))
+            
+        except ccxt.InsufficientFunds as e:
+            logger.error(f"Insufficient balance for batch buying {symbol}: {e}")
+            
+        except Exception as e:
+            logger.error(f"Error placing batch buy orders: {e}")
+        
+        if placed:
+            self._invalidate_balances()
+            logger.info(f"Placed {len(placed)} of {len(base_amounts)} market buy orders for {symbol}")
+        return placed or None
+    
+    def map(self, method, args_list, max_workers=4):
+        """
+        Call a handler method once per argument tuple, in parallel threads
+        
+        Lets synchronous callers issue many independent REST calls at once,
+        e.g. handler.map('get_ticker', [('BTC/USDT',), ('ETH/USDT',)]).
+        Requests still start at most one per rateLimit, the threads only
+        overlap waiting for responses.
+        
+        Args:
+            method: Name of the handler method to call
+            args_list: Iterable of argument tuples, one call per tuple
+            max_workers: Maximum number of calls in flight at once
+            
+        Returns:
+            List of results in the same order as args_list
+        """
+        func = getattr(self, method)
+        args_list = list(args_list)
+        if not args_list:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+            return list(executor.map(lambda args: func(*args), args_list))
+
+def create_handlers(exchange_ids, sandbox=False):
+    """
+    Create handlers for several exchanges concurrently
+    
+    Each handler spends most of its construction time waiting on
+    load_markets(), so connecting in parallel takes roughly as long as
+    the slowest exchange instead of the sum of all of them.
+    
+    Args:
+        exchange_ids: Exchanges to connect to, from config.SUPPORTED_EXCHANGES
+        sandbox: Use sandbox/testnet mode for every handler
+        
+    Returns:
+        Dictionary of exchange_id -> ExchangeHandler
+    """
+    exchange_ids = {exchange_id.lower() for exchange_id in exchange_ids}
+    if not exchange_ids:
+        return {}
+    
+    handlers = {}
+    with ThreadPoolExecutor(max_workers=len(exchange_ids)) as executor:
+        futures = [executor.submit(ExchangeHandler, exchange_id, sandbox) for exchange_id in exchange_ids]
+        for future in as_completed(futures):
+            handler = future.result()
+            handlers[handler.exchange_id] = handler
+    return handlers
\ No newline at end of file
@@ -1,253 +1,523 @@
+import argparse
+import re
+import signal
 import sys
 import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
 from loguru import logger
 
+try:
+    import readline  # Line editing and history for input()
+except ImportError:  # Not available on Windows
+    readline = None
+
 import config
-from exchange import ExchangeHandler
+
+# Log files are written here, relative to the working directory
+LOG_DIR = Path("logs")
+
+# Connected exchange handlers, reused across operations
+_handler_cache = {}
+
+# Input history kept between sessions when readline is available
+HISTORY_FILE = os.path.join(os.path.expanduser('~'), '.exchange_tester_history')
+HISTORY_LENGTH = 100
+
+# Tickers shown by the price action, reused for a few seconds on repeat queries
+TICKER_CACHE_TTL = 3.0
+_ticker_cache = {}
+
+# Exchange menu, built once since the supported exchanges never change
+EXCHANGE_MENU = "\n=== Available Exchanges ===\n" + "\n".join(
+    f"{i}. {exchange.upper()}" for i, exchange in enumerate(config.SUPPORTED_EXCHANGES, 1)
+)
+EXCHANGE_PROMPT = f"\nSelect exchange (1-{len(config.SUPPORTED_EXCHANGES)}): "
+
+# Action menu choice -> action name
+ACTION_CHOICES = {
+    '1': 'buy',
+    '2': 'sell',
+    '3': 'balance',
+    '4': 'price',
+}
+
+# Action menu, printed in one write like EXCHANGE_MENU
+ACTION_MENU = (
+    "\n=== Available Actions ===\n"
+    "1. Buy token\n"
+    "2. Sell token\n"
+    "3. Check balance\n"
+    "4. Check token price"
+)
+
+# Plain decimal number: optional minus sign, digits with at most one decimal point
+NUMBER_PATTERN = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+
+YES_ANSWERS = frozenset({'y', 'yes'})
+NO_ANSWERS = frozenset({'n', 'no'})
+
+# Operation summaries; order results are filled from the dict returned by buy_token/sell_token
+BUY_RESULT_TEMPLATE = (
+    "\n=== Buy Executed Successfully ===\n"
+    "Order ID: {id}\n"
+    "Amount: {amount} {base}\n"
+    "Price: approx. {price} {quote}\n"
+    "Total cost: {cost} {quote}"
+)
+SELL_RESULT_TEMPLATE = (
+    "\n=== Sell Executed Successfully ===\n"
+    "Order ID: {id}\n"
+    "Amount sold: {amount} {base}\n"
+    "Price: approx. {price} {quote}\n"
+    "Total value: {cost} {quote}"
+)
+PRICE_INFO_TEMPLATE = (
+    "\n=== Price Information for {symbol} ===\n"
+    "Last price: {last} {quote}\n"
+    "Bid: {bid} {quote}\n"
+    "Ask: {ask} {quote}\n"
+    "24h high: {high} {quote}\n"
+    "24h low: {low} {quote}\n"
+    "24h volume: {volume} {base}"
+)
+
+@dataclass(frozen=True)
+class SellSpec:
+    """How much to sell: an amount of the base currency or a percentage of holdings"""
+    kind: str  # 'amount' or 'percent'
+    value: float
+
+def load_history():
+    """Load input history from previous sessions"""
+    if readline is None:
+        return
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # First run, or history file not readable
+
+def save_history():
+    """Save input history for the next session"""
+    if readline is None:
+        return
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError as e:
+        logger.warning(f"Could not save input history: {e}")
 
 def setup_logging():
     """Configure logging settings"""
     # Create logs directory if it doesn't exist
-    os.makedirs("logs", exist_ok=True)
+    LOG_DIR.mkdir(exist_ok=True)
     
     logger.remove()  # Remove default handler
-    logger.add("logs/exchange_tester_{time}.log", rotation="500 MB", level=config.LOG_LEVEL)
-    logger.add(lambda msg: print(msg), level=config.LOG_LEVEL)  # Also print to console
+    # File writes happen on loguru's background thread so prompts never wait on disk
+    logger.add(LOG_DIR / "exchange_tester_{time}.log", rotation="500 MB", level=config.LOG_LEVEL,
+               enqueue=True, backtrace=False, diagnose=False)
+    logger.add(sys.stderr, level=config.LOG_LEVEL, backtrace=False, diagnose=False)  # Also print to console
 
-def select_exchange():
-    """Interactive function to select exchange"""
-    print("\n=== Available Exchanges ===")
-    
-    for i, exchange in enumerate(config.SUPPORTED_EXCHANGES, 1):
-        print(f"{i}. {exchange.upper()}")
+def handle_stop_signal(signum, frame):
+    """Interrupt a pending prompt the same way Ctrl-C does"""
+    raise KeyboardInterrupt
+
+def install_signal_handlers():
+    """Let SIGTERM (and SIGHUP where available) end the session and still run cleanup"""
+    signal.signal(signal.SIGTERM, handle_stop_signal)
+    if hasattr(signal, 'SIGHUP'):  # Not available on Windows
+        signal.signal(signal.SIGHUP, handle_stop_signal)
+
+def prompt_until_valid(message, parse):
+    """
+    Ask for input until parse() accepts it
     
+    parse receives the stripped input and returns the parsed value, or
+    raises ValueError with the message to show before asking again.
+    """
     while True:
-        choice = input("\nSelect exchange (1-7): ")
         try:
-            index = int(choice) - 1
-            if 0 <= index < len(config.SUPPORTED_EXCHANGES):
-                selected = config.SUPPORTED_EXCHANGES[index]
-                print(f"\nSelected exchange: {selected.upper()}")
-                return selected
-            else:
-                print("Invalid selection. Please try again.")
-        except ValueError:
-            print("Please enter a number.")
+            return parse(input(message).strip())
+        except ValueError as e:
+            print(e)
+
+def parse_number(text):
+    """Parse a plain decimal number such as '10', '-2' or '0.5'"""
+    # Check the input first instead of relying on float() raising on typos
+    if NUMBER_PATTERN.fullmatch(text) is None:
+        raise ValueError("Please enter a valid number.")
+    return float(text)
+
+def parse_exchange_choice(choice):
+    """Parse a 1-based exchange menu choice into an exchange id"""
+    if not choice.isdecimal():
+        raise ValueError("Please enter a number.")
+    
+    # isdecimal() rules out a sign, so 0 is the only choice that would wrap to
+    # the end of the list; anything past the end is caught by the list itself
+    index = int(choice) - 1
+    if index < 0:
+        raise ValueError("Invalid selection. Please try again.")
+    try:
+        return config.SUPPORTED_EXCHANGES[index]
+    except IndexError:
+        raise ValueError("Invalid selection. Please try again.") from None
+
+def parse_action_choice(choice):
+    """Parse an action menu choice into an action name"""
+    action = ACTION_CHOICES.get(choice)
+    if action is None:
+        raise ValueError("Invalid selection. Please try again.")
+    return action
+
+def parse_symbol(symbol):
+    """Accept any non-empty token symbol"""
+    if not symbol:
+        raise ValueError("Symbol cannot be empty. Please try again.")
+    return symbol
+
+def parse_amount(text):
+    """Parse a strictly positive amount"""
+    amount = parse_number(text)
+    if amount <= 0:
+        raise ValueError("Amount must be greater than zero.")
+    return amount
+
+def parse_percentage(text):
+    """Parse a percentage in the range (0, 100]"""
+    percentage = parse_number(text)
+    if not 0 < percentage <= 100:
+        raise ValueError("Percentage must be between 1 and 100.")
+    return percentage
+
+def parse_yes_no(text):
+    """Parse a y/yes or n/no answer"""
+    text = text.casefold()
+    if text in YES_ANSWERS:
+        return True
+    elif text in NO_ANSWERS:
+        return False
+    raise ValueError("Please enter 'y' or 'n'")
+
+def select_exchange():
+    """Interactive function to select exchange"""
+    print(EXCHANGE_MENU)
+    
+    selected = prompt_until_valid(EXCHANGE_PROMPT, parse_exchange_choice)
+    print(f"\nSelected exchange: {selected.upper()}")
+    return selected
 
 def select_action():
     """Interactive function to select action"""
-    print("\n=== Available Actions ===")
-    print("1. Buy token")
-    print("2. Sell token")
-    print("3. Check balance")
-    print("4. Check token price")
+    print(ACTION_MENU)
     
-    while True:
-        choice = input("\nSelect action (1-4): ")
-        if choice == '1':
-            return 'buy'
-        elif choice == '2':
-            return 'sell'
-        elif choice == '3':
-            return 'balance'
-        elif choice == '4':
-            return 'price'
-        else:
-            print("Invalid selection. Please try again.")
+    return prompt_until_valid("\nSelect action (1-4): ", parse_action_choice)
 
 def get_token_symbol():
     """Get token symbol from user"""
-    while True:
-        symbol = input("\nEnter token symbol (e.g., BTC): ").strip()
-        if symbol:
-            return symbol
-        print("Symbol cannot be empty. Please try again.")
+    return prompt_until_valid("\nEnter token symbol (e.g., BTC): ", parse_symbol)
 
-def get_amount(action, currency):
-    """Get amount for buy/sell"""
-    while True:
-        if action == 'buy':
-            prompt = f"\nEnter amount to spend in {currency}: "
-        else:  # sell
-            prompt = f"\nEnter amount to sell in {currency} (or press Enter to sell by percentage): "
-        
-        amount_input = input(prompt).strip()
-        
-        # For sell, empty input means use percentage
-        if action == 'sell' and not amount_input:
-            return get_percentage()
-        
-        try:
-            amount = float(amount_input)
-            if amount <= 0:
-                print("Amount must be greater than zero.")
-                continue
-            return amount
-        except ValueError:
-            print("Please enter a valid number.")
+def get_amount(currency):
+    """Get amount to spend on a buy"""
+    return prompt_until_valid(f"\nEnter amount to spend in {currency}: ", parse_amount)
+
+def get_sell_spec(currency):
+    """Get amount or percentage of holdings to sell"""
+    # Empty input means sell by percentage
+    amount = prompt_until_valid(
+        f"\nEnter amount to sell in {currency} (or press Enter to sell by percentage): ",
+        lambda text: parse_amount(text) if text else None
+    )
+    if amount is None:
+        return SellSpec('percent', get_percentage())
+    return SellSpec('amount', amount)
 
 def get_percentage():
     """Get percentage for sell"""
-    while True:
-        percentage_input = input("\nEnter percentage of holdings to sell (1-100): ").strip()
-        try:
-            percentage = float(percentage_input)
-            if 0 < percentage <= 100:
-                return None, percentage  # Return (None, percentage) for sell by percentage
-            else:
-                print("Percentage must be between 1 and 100.")
-        except ValueError:
-            print("Please enter a valid number.")
+    return prompt_until_valid("\nEnter percentage of holdings to sell (1-100): ", parse_percentage)
 
 def ask_continue():
     """Ask if user wants to continue with another operation"""
-    while True:
-        choice = input("\nDo you want to continue with another operation? (y/n): ").strip().lower()
-        if choice in ['y', 'yes']:
-            return True
-        elif choice in ['n', 'no']:
-            return False
-        else:
-            print("Please enter 'y' or 'n'")
+    return prompt_until_valid("\nDo you want to continue with another operation? (y/n): ", parse_yes_no)
 
-def perform_operation():
-    """Perform a single operation (buy, sell, check balance, check price)"""
+def ask_change_exchange(exchange_id):
+    """Ask if user wants to switch to a different exchange"""
+    return prompt_until_valid(f"\nSwitch from {exchange_id.upper()} to another exchange? (y/n): ", parse_yes_no)
+
+def get_exchange_handler(exchange_id):
+    """Get a connected handler for exchange_id, connecting on first use"""
+    exchange_handler = _handler_cache.get(exchange_id)
+    if exchange_handler is None:
+        # Imported here so ccxt's slow import happens after the menus are shown
+        from exchange import ExchangeHandler
+        exchange_handler = ExchangeHandler(exchange_id, sandbox=False)
+        _handler_cache[exchange_id] = exchange_handler
+    return exchange_handler
+
+def get_display_ticker(exchange_handler, symbol):
+    """Get ticker for display, reusing one fetched within TICKER_CACHE_TTL seconds"""
+    key = (exchange_handler.exchange_id, symbol)
+    now = time.monotonic()
+    cached = _ticker_cache.get(key)
+    if cached and now - cached[0] < TICKER_CACHE_TTL:
+        return cached[1]
+    
+    ticker = exchange_handler.get_ticker(symbol)
+    if ticker:
+        _ticker_cache[key] = (now, ticker)
+    return ticker
+
+def choose_exchange():
+    """Select an exchange and connect to it, returns the handler or None if connecting failed"""
     try:
-        # Step 1: Select exchange
         exchange_id = select_exchange()
-        
-        # Step 2: Initialize exchange handler
-        exchange_handler = ExchangeHandler(exchange_id, sandbox=False)
-        
-        # Step 3: Select action
-        action = select_action()
-        
-        if action in ['buy', 'sell', 'price']:
-            # Step 2: Get token symbol
-            base_symbol = get_token_symbol()
-            
-            # Format symbol with USDT
-            symbol = f"{base_symbol.upper()}/{config.QUOTE_CURRENCY}"
-            
-            # Check if symbol exists
-            exists, formatted_symbol = exchange_handler.check_pair_exists(symbol)
-            if not exists:
-                print(f"Trading pair {symbol} not found on {exchange_handler.exchange_id.upper()}. Please check the symbol and try again.")
-                return
-            
-            symbol = formatted_symbol
-            
-            if action == 'buy':
-                # Step 3a: For buy, get amount in USDT
-                amount = get_amount('buy', config.QUOTE_CURRENCY)
-                
-                # Execute buy
-                print(f"\nExecuting buy: {amount} {config.QUOTE_CURRENCY} of {symbol}...")
-                result = exchange_handler.buy_token(symbol, amount)
-                
-                if result:
-                    print("\n=== Buy Executed Successfully ===")
-                    print(f"Order ID: {result['id']}")
-                    print(f"Amount: {result['amount']} {symbol.split('/')[0]}")
-                    print(f"Price: approx. {result['price']} {symbol.split('/')[1]}")
-                    print(f"Total cost: {result['cost']} {symbol.split('/')[1]}")
-                else:
-                    print("\nBuy operation failed. Check the logs for details.")
-            
-            elif action == 'sell':
-                # Step 3b: For sell, get amount in base currency or percentage
-                base_currency = symbol.split('/')[0]  # e.g., BTC in BTC/USDT
-                
-                # Get current balance first
-                free_balance, total_balance = exchange_handler.get_balance(base_currency)
-                if free_balance <= 0:
-                    print(f"You don't have any {base_currency} to sell.")
-                    return
-                
-                print(f"\nAvailable balance: {free_balance} {base_currency}")
-                
-                # Get amount or percentage
-                amount_input = get_amount('sell', base_currency)
-                
-                # Check if it's (None, percentage) for percentage-based sell
-                if isinstance(amount_input, tuple):
-                    amount, percentage = amount_input
-                    sell_amount = None  # Signal to use percentage
-                else:
-                    amount = amount_input
-                    percentage = 100  # Default if specific amount
-                    sell_amount = amount
-                
-                # Execute sell
-                if sell_amount:
-                    print(f"\nExecuting sell: {sell_amount} {base_currency}...")
-                else:
-                    print(f"\nExecuting sell: {percentage}% of {base_currency} holdings...")
-                
-                result = exchange_handler.sell_token(symbol, sell_amount, percentage)
-                
-                if result:
-                    print("\n=== Sell Executed Successfully ===")
-                    print(f"Order ID: {result['id']}")
-                    print(f"Amount sold: {result['amount']} {symbol.split('/')[0]}")
-                    print(f"Price: approx. {result['price']} {symbol.split('/')[1]}")
-                    print(f"Total value: {result['cost']} {symbol.split('/')[1]}")
-                else:
-                    print("\nSell operation failed. Check the logs for details.")
-            
-            elif action == 'price':
-                # Get and display price info
-                ticker = exchange_handler.get_ticker(symbol)
-                if ticker:
-                    print(f"\n=== Price Information for {symbol} ===")
-                    print(f"Last price: {ticker['last']} {config.QUOTE_CURRENCY}")
-                    print(f"Bid: {ticker.get('bid', 'N/A')} {config.QUOTE_CURRENCY}")
-                    print(f"Ask: {ticker.get('ask', 'N/A')} {config.QUOTE_CURRENCY}")
-                    print(f"24h high: {ticker.get('high', 'N/A')} {config.QUOTE_CURRENCY}")
-                    print(f"24h low: {ticker.get('low', 'N/A')} {config.QUOTE_CURRENCY}")
-                    print(f"24h volume: {ticker.get('volume', 'N/A')} {symbol.split('/')[0]}")
-                else:
-                    print(f"\nFailed to get price information for {symbol}.")
-        
-        elif action == 'balance':
-            # Get and display balances
-            balances = exchange_handler.get_balance()
-            
-            if balances:
-                print("\n=== Available Balances ===")
-                # First show USDT balance if available
-                if config.QUOTE_CURRENCY in balances:
-                    usdt_balance = balances[config.QUOTE_CURRENCY]
-                    print(f"{config.QUOTE_CURRENCY}: {usdt_balance['free']} (Total: {usdt_balance['total']})")
-                    
-                # Then show other balances
-                for currency, amounts in balances.items():
-                    if currency != config.QUOTE_CURRENCY:
-                        print(f"{currency}: {amounts['free']} (Total: {amounts['total']})")
-            else:
-                print("\nNo balances found or error retrieving balances.")
+        return get_exchange_handler(exchange_id)
+    except Exception as e:
+        logger.error(f"Error connecting to exchange: {e}")
+        print(f"\nAn error occurred: {e}")
+        return None
+
+def resolve_symbol(exchange_handler):
+    """Ask for a token and return its trading pair symbol, or None if the exchange doesn't list it"""
+    base_symbol = get_token_symbol()
+    
+    # Format symbol with USDT
+    symbol = f"{base_symbol.upper()}/{config.QUOTE_CURRENCY}"
+    
+    # Check if symbol exists
+    exists, formatted_symbol = exchange_handler.check_pair_exists(symbol)
+    if not exists:
+        print(f"Trading pair {symbol} not found on {exchange_handler.exchange_id.upper()}. Please check the symbol and try again.")
+        return None
+    return formatted_symbol
+
+def do_buy(exchange_handler):
+    """Buy a token for an amount of the quote currency"""
+    symbol = resolve_symbol(exchange_handler)
+    if symbol is None:
+        return
+    base_currency, _, quote_currency = symbol.partition('/')  # e.g., BTC and USDT in BTC/USDT
+    
+    amount = get_amount(quote_currency)
+    
+    print(f"\nExecuting buy: {amount} {quote_currency} of {symbol}...")
+    result = exchange_handler.buy_token(symbol, amount)
+    
+    if result:
+        print(BUY_RESULT_TEMPLATE.format(**result, base=base_currency, quote=quote_currency))
+    else:
+        print("\nBuy operation failed. Check the logs for details.")
+
+def do_sell(exchange_handler):
+    """Sell a token by amount or by percentage of holdings"""
+    symbol = resolve_symbol(exchange_handler)
+    if symbol is None:
+        return
+    base_currency, _, quote_currency = symbol.partition('/')
+    
+    # Get current balance first
+    free_balance, total_balance = exchange_handler.get_balance(base_currency)
+    if free_balance <= 0:
+        print(f"You don't have any {base_currency} to sell.")
+        return
+    
+    print(f"\nAvailable balance: {free_balance} {base_currency}")
+    
+    # Get amount or percentage
+    spec = get_sell_spec(base_currency)
+    if spec.kind == 'percent':
+        sell_amount = None  # Signal to use percentage
+        percentage = spec.value
+    else:
+        sell_amount = spec.value
+        percentage = 100  # Default if specific amount
     
+    if sell_amount:
+        print(f"\nExecuting sell: {sell_amount} {base_currency}...")
+    else:
+        print(f"\nExecuting sell: {percentage}% of {base_currency} holdings...")
+    
+    result = exchange_handler.sell_token(symbol, sell_amount, percentage)
+    
+    if result:
+        print(SELL_RESULT_TEMPLATE.format(**result, base=base_currency, quote=quote_currency))
+    else:
+        print("\nSell operation failed. Check the logs for details.")
+
+def show_price(exchange_handler):
+    """Display ticker information for a token"""
+    symbol = resolve_symbol(exchange_handler)
+    if symbol is None:
+        return
+    base_currency, _, quote_currency = symbol.partition('/')
+    
+    ticker = get_display_ticker(exchange_handler, symbol)
+    if ticker:
+        print(PRICE_INFO_TEMPLATE.format(
+            symbol=symbol, base=base_currency, quote=quote_currency, last=ticker['last'],
+            **{field: ticker.get(field, 'N/A') for field in ('bid', 'ask', 'high', 'low', 'volume')}
+        ))
+    else:
+        print(f"\nFailed to get price information for {symbol}.")
+
+def show_balances(exchange_handler):
+    """Display all non-zero balances, quote currency first"""
+    quote_ccy = config.QUOTE_CURRENCY
+    balances = exchange_handler.get_balance()
+    
+    if balances:
+        sys.stdout.write("\n=== Available Balances ===\n")
+        # First show USDT balance if available, taking it out of the (fresh) dict
+        usdt_balance = balances.pop(quote_ccy, None)
+        if usdt_balance:
+            sys.stdout.write(f"{quote_ccy}: {usdt_balance['free']} (Total: {usdt_balance['total']})\n")
+            
+        # Then stream the other balances without building a list
+        sys.stdout.writelines(
+            f"{currency}: {amounts['free']} (Total: {amounts['total']})\n"
+            for currency, amounts in balances.items()
+        )
+    else:
+        print("\nNo balances found or error retrieving balances.")
+
+# Action name -> function performing it on the selected exchange
+ACTION_HANDLERS = {
+    'buy': do_buy,
+    'sell': do_sell,
+    'balance': show_balances,
+    'price': show_price,
+}
+
+def perform_operation(exchange_handler):
+    """Perform a single operation (buy, sell, check balance, check price)"""
+    try:
+        action = select_action()
+        ACTION_HANDLERS[action](exchange_handler)
     except Exception as e:
         logger.error(f"Error during operation: {e}")
         print(f"\nAn error occurred: {e}")
 
+def read_batch_file(path):
+    """
+    Read queued operations from a batch file
+    
+    Each line is 'price,SYMBOL' or 'balance' / 'balance,CURRENCY'.
+    Blank lines and lines starting with '#' are ignored.
+    
+    Returns:
+        List of (action, symbol) tuples, symbol may be empty for balance
+    """
+    operations = []
+    with open(path) as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            action, _, symbol = line.partition(',')
+            action, symbol = action.strip().lower(), symbol.strip()
+            if action not in ('price', 'balance') or (action == 'price' and not symbol):
+                print(f"Line {line_no}: skipping invalid operation '{line}'")
+                continue
+            operations.append((action, symbol))
+    return operations
+
+def run_batch(exchange_id, operations):
+    """Run the price and balance queries read from a batch file, fetching all prices at once"""
+    if not operations:
+        print("No operations to run.")
+        return
+    
+    exchange_handler = get_exchange_handler(exchange_id)
+    
+    # Resolve every symbol first, then fetch all tickers together
+    pairs = {}
+    for action, symbol in operations:
+        if action == 'price' and symbol not in pairs:
+            exists, formatted_symbol = exchange_handler.check_pair_exists(symbol)
+            pairs[symbol] = formatted_symbol if exists else None
+    
+    symbols = sorted({pair for pair in pairs.values() if pair})
+    tickers = exchange_handler.get_tickers(symbols)
+    
+    for action, symbol in operations:
+        if action == 'price':
+            pair = pairs[symbol]
+            ticker = tickers.get(pair) if pair else None
+            if not pair:
+                print(f"{symbol}: trading pair not found on {exchange_id.upper()}")
+            elif not ticker:
+                print(f"{pair}: failed to get price information")
+            else:
+                print(f"{pair}: {ticker['last']} (Bid: {ticker.get('bid', 'N/A')}, Ask: {ticker.get('ask', 'N/A')})")
+        
+        elif symbol:
+            # One fetch_balance serves every balance line through the handler's cache
+            free_balance, total_balance = exchange_handler.get_balance(symbol)
+            print(f"{symbol.upper()}: {free_balance} (Total: {total_balance})")
+        
+        else:
+            sys.stdout.writelines(
+                f"{currency}: {amounts['free']} (Total: {amounts['total']})\n"
+                for currency, amounts in exchange_handler.get_balance().items()
+            )
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Interactive cryptocurrency exchange tester")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="run the price/balance queries listed in FILE instead of the interactive menu")
+    parser.add_argument('--exchange', choices=config.SUPPORTED_EXCHANGES,
+                        help="exchange to use with --batch")
+    args = parser.parse_args()
+    if args.batch and not args.exchange:
+        parser.error("--batch requires --exchange")
+    return args
+
 def main():
+    args = parse_args()
+    
     # Setup logging
     setup_logging()
     
+    if args.batch:
+        try:
+            operations = read_batch_file(args.batch)
+        except OSError as e:
+            print(f"Could not read batch file: {e}")
+            return
+        
+        try:
+            run_batch(args.exchange, operations)
+        except Exception as e:
+            logger.error(f"Error: {e}")
+            print(f"\nAn error occurred: {e}")
+        return
+    
     print("\n==================================")
     print("=== Cryptocurrency Exchange Tester ===")
     print("==================================")
     
+    load_history()
+    install_signal_handlers()
+    
     try:
-        # Main program loop
+        # Main program loop, staying on the selected exchange until the user switches
+        exchange_handler = None
         while True:
-            # Perform one operation (includes exchange selection)
-            perform_operation()
+            if exchange_handler is None:
+                exchange_handler = choose_exchange()
+            
+            if exchange_handler:
+                perform_operation(exchange_handler)
             
             # Ask if user wants to continue
             if not ask_continue():
                 break
+            
+            if exchange_handler and ask_change_exchange(exchange_handler.exchange_id):
+                exchange_handler = None
     
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
@@ -257,6 +527,7 @@ def main():
         print(f"\nAn error occurred: {e}")
     
     finally:
+        save_history()
         print("\nDone. Thank you for using the Cryptocurrency Exchange Tester!")
 
 if __name__ == "__main__":
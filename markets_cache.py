@@ -0,0 +1,56 @@
+import gzip
+import json
+import os
+import time
+
+from loguru import logger
+
+class FileCache:
+    """Gzipped JSON values stored one file per key, each valid for ttl seconds"""
+    
+    def __init__(self, directory, ttl):
+        self.directory = directory
+        self.ttl = ttl
+    
+    @property
+    def enabled(self):
+        return self.ttl > 0
+    
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json.gz")
+    
+    def get(self, key):
+        """Return the cached value for key, or None if missing, expired or unreadable"""
+        if not self.enabled:
+            return None
+        
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                return None
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+    
+    def set(self, key, value):
+        """Store value under key, written atomically so readers never see a partial file"""
+        if not self.enabled:
+            return
+        
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(value, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass  # Never created, or already gone